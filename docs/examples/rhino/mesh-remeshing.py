@@ -6,8 +6,15 @@ import rhinoscriptsyntax as rs
 import compas_rhino
 
 from compas.datastructures import Mesh
-from compas.topology import delaunay_from_points
-from compas.topology import trimesh_remesh
+from compas.datastructures import trimesh_remesh
+from compas.geometry import centroid_points
+from compas.geometry import is_point_in_polygon_xy
+from compas.geometry import delaunay_from_points
+
+try:
+    from compas.geometry import delaunay_from_points_numpy
+except ImportError:
+    delaunay_from_points_numpy = None
 
 from compas_rhino.conduits import MeshConduit
 
@@ -27,8 +34,15 @@ points   = rs.DivideCurve(boundary, rs.CurveLength(boundary) / length)
 
 # generate a delaunay triangulation
 # from the points on the boundary
+# use Qhull (through scipy) if available
+# and discard the triangles of the convex hull outside the boundary
+
+if delaunay_from_points_numpy:
+    faces = delaunay_from_points_numpy(points).tolist()
+    faces = [face for face in faces if is_point_in_polygon_xy(centroid_points([points[index] for index in face]), points)]
+else:
+    faces = delaunay_from_points(points, boundary=points)
 
-faces = delaunay_from_points(points, boundary=points)
 mesh = Mesh.from_vertices_and_faces(points, faces)
 
 
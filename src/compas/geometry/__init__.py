@@ -446,6 +446,8 @@ Optimisation
     bestfit_circle_numpy
     bestfit_plane
     bestfit_plane_numpy
+    bestfit_planes_numpy
+    bestfit_sphere_numpy
 
 Other functions
 ===============
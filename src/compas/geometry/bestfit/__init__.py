@@ -9,5 +9,7 @@ from .bestfit import *
 if not compas.IPY:
     from .bestfit_numpy import *
 
+# from .bestfit_numba import *
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
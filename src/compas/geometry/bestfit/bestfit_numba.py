@@ -0,0 +1,254 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from math import sqrt
+
+from numba import f8
+from numba import jit
+
+try:
+    from numba import prange
+except ImportError:
+    prange = range
+
+from numpy import ascontiguousarray
+from numpy import zeros
+from numpy.linalg import solve
+
+from compas.geometry import local_coords_numpy
+
+from compas.numerical import pca_numpy
+
+
+__all__ = [
+    'bestfit_circle_numba',
+    'bestfit_sphere_numba',
+]
+
+
+@jit(f8[:, :](f8[:, :]), nogil=True, nopython=True, parallel=True, cache=True)
+def _sphere_normal_equations_numba(xyz):
+    # the augmented normal equations [A^T A | A^T f] of the algebraic sphere fit
+    # with rows of A = [2x, 2y, 2z, 1] and f = x^2 + y^2 + z^2
+    # the coordinates are taken relative to the first point
+    # to keep the sums well-conditioned for points far from the origin
+    sxx = sxy = sxz = syy = syz = szz = 0.0
+    sx = sy = sz = 0.0
+    sfx = sfy = sfz = sf = 0.0
+    n = xyz.shape[0]
+    x0 = xyz[0, 0]
+    y0 = xyz[0, 1]
+    z0 = xyz[0, 2]
+    for i in prange(n):
+        x = xyz[i, 0] - x0
+        y = xyz[i, 1] - y0
+        z = xyz[i, 2] - z0
+        r = x * x + y * y + z * z
+        sxx += x * x
+        sxy += x * y
+        sxz += x * z
+        syy += y * y
+        syz += y * z
+        szz += z * z
+        sx += x
+        sy += y
+        sz += z
+        sfx += r * x
+        sfy += r * y
+        sfz += r * z
+        sf += r
+    N = zeros((4, 5))
+    N[0, 0] = 4 * sxx
+    N[0, 1] = N[1, 0] = 4 * sxy
+    N[0, 2] = N[2, 0] = 4 * sxz
+    N[1, 1] = 4 * syy
+    N[1, 2] = N[2, 1] = 4 * syz
+    N[2, 2] = 4 * szz
+    N[0, 3] = N[3, 0] = 2 * sx
+    N[1, 3] = N[3, 1] = 2 * sy
+    N[2, 3] = N[3, 2] = 2 * sz
+    N[3, 3] = n
+    N[0, 4] = 2 * sfx
+    N[1, 4] = 2 * sfy
+    N[2, 4] = 2 * sfz
+    N[3, 4] = sf
+    return N
+
+
+@jit(f8[:, :](f8[:], f8[:]), nogil=True, nopython=True, parallel=True, cache=True)
+def _circle_normal_equations_numba(x, y):
+    # the augmented normal equations [A^T A | A^T b] of the algebraic circle fit
+    # with rows of A = [2x, 2y, 1] and b = x^2 + y^2
+    sxx = sxy = syy = sx = sy = 0.0
+    sbx = sby = sb = 0.0
+    n = x.shape[0]
+    for i in prange(n):
+        xi = x[i]
+        yi = y[i]
+        b = xi * xi + yi * yi
+        sxx += xi * xi
+        sxy += xi * yi
+        syy += yi * yi
+        sx += xi
+        sy += yi
+        sbx += b * xi
+        sby += b * yi
+        sb += b
+    N = zeros((3, 4))
+    N[0, 0] = 4 * sxx
+    N[0, 1] = N[1, 0] = 4 * sxy
+    N[1, 1] = 4 * syy
+    N[0, 2] = N[2, 0] = 2 * sx
+    N[1, 2] = N[2, 1] = 2 * sy
+    N[2, 2] = n
+    N[0, 3] = 2 * sbx
+    N[1, 3] = 2 * sby
+    N[2, 3] = sb
+    return N
+
+
+@jit(f8[:, :](f8[:], f8[:], f8, f8), nogil=True, nopython=True, parallel=True, cache=True)
+def _circle_gauss_newton_numba(x, y, xc, yc):
+    # the augmented Gauss-Newton system [J^T J | J^T r] of the geometric circle fit
+    # with residuals r = R - mean(R) and R the distances to (xc, yc)
+    sa = sb = sr = 0.0
+    saa = sab = sbb = sar = sbr = 0.0
+    n = x.shape[0]
+    for i in prange(n):
+        dx = xc - x[i]
+        dy = yc - y[i]
+        r = sqrt(dx * dx + dy * dy)
+        a = dx / r
+        b = dy / r
+        sa += a
+        sb += b
+        sr += r
+        saa += a * a
+        sab += a * b
+        sbb += b * b
+        sar += a * r
+        sbr += b * r
+    N = zeros((2, 3))
+    N[0, 0] = saa - sa * sa / n
+    N[0, 1] = N[1, 0] = sab - sa * sb / n
+    N[1, 1] = sbb - sb * sb / n
+    N[0, 2] = sar - sa * sr / n
+    N[1, 2] = sbr - sb * sr / n
+    return N
+
+
+@jit(f8(f8[:], f8[:], f8, f8), nogil=True, nopython=True, parallel=True, cache=True)
+def _mean_distance_numba(x, y, xc, yc):
+    s = 0.0
+    n = x.shape[0]
+    for i in prange(n):
+        dx = xc - x[i]
+        dy = yc - y[i]
+        s += sqrt(dx * dx + dy * dy)
+    return s / n
+
+
+def bestfit_circle_numba(points):
+    """Fit a circle through a set of points using Numba.
+
+    Parameters
+    ----------
+    points : list
+        XYZ coordinates of the points.
+
+    Returns
+    -------
+    tuple
+        XYZ coordinates of the center of the circle, the normal vector of the
+        local frame, and the radius of the circle.
+
+    Notes
+    -----
+    The circle is fitted algebraically, as in :func:`bestfit_circle_numpy`,
+    but refined with a single Gauss-Newton step instead of a full
+    Levenberg-Marquardt solve. The sums over the points are accumulated in
+    compiled, parallel loops instead of through temporary arrays.
+    This only pays off for very large numbers of points.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        #
+
+    """
+    xyz = ascontiguousarray(points, dtype=float).reshape((-1, 3))
+    o, uvw, _ = pca_numpy(xyz)
+    rst = local_coords_numpy(o, uvw, xyz)
+    x = ascontiguousarray(rst[:, 0])
+    y = ascontiguousarray(rst[:, 1])
+
+    N = _circle_normal_equations_numba(x, y)
+    xc, yc, k = solve(N[:, :3], N[:, 3])
+
+    N = _circle_gauss_newton_numba(x, y, xc, yc)
+    dx, dy = solve(N[:, :2], N[:, 2])
+    xc -= dx
+    yc -= dy
+
+    R = _mean_distance_numba(x, y, xc, yc)
+
+    # the center in global coordinates
+    center = o[0] + xc * uvw[0] + yc * uvw[1]
+
+    return center.tolist(), uvw[2].tolist(), R
+
+
+def bestfit_sphere_numba(points):
+    """Returns the sphere's center and radius that fits best through a set of points, using Numba.
+
+    Parameters
+    ----------
+    points: list of points
+        XYZ coordinates of the points.
+
+    Returns
+    -------
+    tuple: center, radius
+        sphere center (XYZ coordinates) and sphere radius.
+
+    Notes
+    -----
+    This is the same fit as :func:`bestfit_sphere_numpy`, but the normal
+    equations are accumulated in a single compiled, parallel pass over the
+    points, without assembling the A matrix.
+
+    Examples
+    --------
+    >>> from compas.geometry import allclose
+    >>> from compas.geometry import bestfit_sphere_numpy
+    >>> from compas.geometry.bestfit.bestfit_numba import bestfit_sphere_numba
+    >>> points = [(291.580, -199.041, 120.194), (293.003, -52.379, 33.599),\
+                  (514.217, 26.345, 29.143), (683.253, 26.510, -6.194),\
+                  (683.247, -327.154, 179.113), (231.606, -430.659, 115.458),\
+                  (87.278, -419.178, -18.863), (24.731, -340.222, -127.158)]
+    >>> center, radius = bestfit_sphere_numba(points)
+    >>> c, r = bestfit_sphere_numpy(points)
+    >>> allclose(center, c) and allclose([radius], [r])
+    True
+
+    """
+    xyz = ascontiguousarray(points, dtype=float).reshape((-1, 3))
+
+    N = _sphere_normal_equations_numba(xyz)
+    C = solve(N[:, :4], N[:, 4])
+
+    # solve for the radius
+    radius = sqrt(C[0] * C[0] + C[1] * C[1] + C[2] * C[2] + C[3])
+    return (C[:3] + xyz[0]).tolist(), radius
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    doctest.testmod()
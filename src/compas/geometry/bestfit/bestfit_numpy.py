@@ -2,25 +2,29 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from numpy import asarray
+from numpy import ascontiguousarray
 from numpy import sqrt
-from numpy import mean
-from numpy import sum
-from numpy import zeros
-from numpy.linalg import lstsq
-
-from scipy.linalg import svd
-from scipy.optimize import leastsq
+from numpy import empty
+from numpy import stack
+from numpy import multiply
+from numpy import einsum
+from numpy import cross
+from numpy.linalg import solve
+from numpy.linalg import norm
+from numpy.linalg import eigh
+
+from scipy.linalg.lapack import dsyevr
+from scipy.optimize import least_squares
 
 # should this not be defined in a different location?
 from compas.geometry import local_coords_numpy
-from compas.geometry import global_coords_numpy
 
 from compas.numerical import pca_numpy
 
 
 __all__ = [
     'bestfit_plane_numpy',
+    'bestfit_planes_numpy',
     'bestfit_circle_numpy',
     'bestfit_sphere_numpy',
 ]
@@ -50,14 +54,79 @@ def bestfit_plane_numpy(points):
         #
 
     """
-    xyz = asarray(points).reshape((-1, 3))
+    xyz = ascontiguousarray(points, dtype=float).reshape((-1, 3))
     n = xyz.shape[0]
+    if n == 3:
+        # three points define the plane exactly
+        # unless they are (nearly) collinear or coincident,
+        # which is left to the general case below
+        u = xyz[1] - xyz[0]
+        v = xyz[2] - xyz[0]
+        w = cross(u, v)
+        length = norm(w)
+        if length > 1e-12 * norm(u) * norm(v):
+            c = xyz.mean(axis=0).reshape((-1, 3))
+            return c, w / length
     m = 1.0 / (n - 1.0)
-    c = (sum(xyz, axis=0) / n).reshape((-1, 3))
+    c = (xyz.sum(axis=0) / n).reshape((-1, 3))
+    # the points are centered before forming the scatter matrix
+    # expanding it into raw moments cancels catastrophically
+    # for points far from the origin
     Yt = xyz - c
     C = m * Yt.T.dot(Yt)
-    u, s, vT = svd(C)
-    w = vT[2, :]
+    # C is symmetric
+    # the normal is the eigenvector of the smallest eigenvalue
+    # and only that eigenpair is computed
+    _, v, _, _, _ = dsyevr(C, range='I', il=1, iu=1)
+    w = v[:, 0]
+    return c, w
+
+
+def bestfit_planes_numpy(points):
+    """Fit planes through multiple sets of the same number of points.
+
+    Warning
+    -------
+    This function requires Numpy.
+
+    Parameters
+    ----------
+    points : list
+        XYZ coordinates of the points per set, as a nested list or array of
+        shape (number of sets, number of points per set, 3).
+
+    Returns
+    -------
+    tuple
+        The centroids of the sets of points, and the normal vectors of the planes.
+
+    Notes
+    -----
+    The covariance matrices of all sets are decomposed in a single call,
+    which is much faster than calling :func:`bestfit_plane_numpy` per set
+    when there are many small sets, such as the faces of a mesh.
+
+    Examples
+    --------
+    >>> from compas.geometry import bestfit_planes_numpy
+    >>> points = [[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+    ...           [[0, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 1]]]
+    >>> c, w = bestfit_planes_numpy(points)
+    >>> c.tolist()
+    [[0.5, 0.5, 0.0], [0.0, 0.5, 0.5]]
+    >>> abs(w).tolist()
+    [[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]]
+
+    """
+    xyz = ascontiguousarray(points, dtype=float)
+    n = xyz.shape[1]
+    c = xyz.mean(axis=1)
+    Yt = xyz - c[:, None, :]
+    C = einsum('bni,bnj->bij', Yt, Yt) / (n - 1.0)
+    # eigh decomposes all covariance matrices at once
+    # and returns the eigenvalues in ascending order
+    _, v = eigh(C)
+    w = v[:, :, 0]
     return c, w
 
 
@@ -136,11 +205,15 @@ def bestfit_circle_numpy(points):
 
     Notes
     -----
-    For more information see [1]_.
+    The circle is first fitted algebraically [1]_, in the plane of the
+    principal components of the points, and then refined with
+    Levenberg-Marquardt on the geometric distances [2]_.
 
     References
     ----------
-    .. [1] Scipy. *Least squares circle*.
+    .. [1] Kasa, I., 1976. *A circle fitting procedure and its error analysis*.
+           IEEE Transactions on Instrumentation and Measurement 25(1): 8-14.
+    .. [2] Scipy. *Least squares circle*.
            Available at: http://scipy-cookbook.readthedocs.io/items/Least_Squares_Circle.html.
 
     Examples
@@ -150,8 +223,9 @@ def bestfit_circle_numpy(points):
         #
 
     """
-    o, uvw, _ = pca_numpy(points)
-    rst = local_coords_numpy(o, uvw, points)
+    xyz = ascontiguousarray(points, dtype=float).reshape((-1, 3))
+    o, uvw, _ = pca_numpy(xyz)
+    rst = local_coords_numpy(o, uvw, xyz)
     x = rst[:, 0]
     y = rst[:, 1]
 
@@ -162,22 +236,35 @@ def bestfit_circle_numpy(points):
         Ri = dist(*c)
         return Ri - Ri.mean()
 
-    xm = mean(x)
-    ym = mean(y)
-    c0 = xm, ym
-    c, ier = leastsq(f, c0)
+    def Df(c):
+        xc, yc = c
+        dx = xc - x
+        dy = yc - y
+        Ri = sqrt(dx * dx + dy * dy)
+        dRdx = dx / Ri
+        dRdy = dy / Ri
+        return stack([dRdx - dRdx.mean(), dRdy - dRdy.mean()], axis=1)
+
+    # algebraic fit
+    # (x - xc)**2 + (y - yc)**2 = R**2 is linear in xc, yc and k = R**2 - xc**2 - yc**2
+    A = empty((x.shape[0], 3))
+    A[:, 0] = 2 * x
+    A[:, 1] = 2 * y
+    A[:, 2] = 1
+    b = x * x + y * y
+    xc, yc, k = solve(A.T.dot(A), A.T.dot(b))
+
+    # refine on the geometric residuals
+    res = least_squares(f, (xc, yc), jac=Df, method='lm', x_scale='jac')
+    c = res.x
+
     Ri = dist(*c)
     R = Ri.mean()
-    residu = sum((Ri - R) ** 2)
-
-    print(residu)
-
-    xyz = global_coords_numpy(o, uvw, [[c[0], c[1], 0.0]])[0]
 
-    o = xyz.tolist()
-    u, v, w = uvw.tolist()
+    # the center in global coordinates
+    center = o[0] + c[0] * uvw[0] + c[1] * uvw[1]
 
-    return o, w, R
+    return center.tolist(), uvw[2].tolist(), float(R)
 
 
 def bestfit_sphere_numpy(points):
@@ -212,25 +299,32 @@ def bestfit_sphere_numpy(points):
     >>> center, radius = bestfit_sphere_numpy(points)
     """
 
+    xyz = ascontiguousarray(points, dtype=float).reshape((-1, 3))
+
+    # fit relative to the centroid
+    # the normal equations square the condition number of A
+    # which is otherwise very poor for points far from the origin
+    c = xyz.mean(axis=0)
+    xyz = xyz - c
+
     # Assemble the A matrix
-    spX = asarray([p[0] for p in points])
-    spY = asarray([p[1] for p in points])
-    spZ = asarray([p[2] for p in points])
-    A = zeros((len(spX), 4))
-    A[:, 0] = spX*2
-    A[:, 1] = spY*2
-    A[:, 2] = spZ*2
+    # in column-major order, since it is only used column-wise in A.T.dot(A)
+    A = empty((xyz.shape[0], 4), order='F')
+    multiply(xyz, 2.0, out=A[:, :3])
     A[:, 3] = 1
 
-    # Assemble the f matrix
-    f = zeros((len(spX), 1))
-    f[:, 0] = (spX*spX) + (spY*spY) + (spZ*spZ)
-    C, residules, rank, singval = lstsq(A, f)
+    # Assemble the f vector
+    # the squared norms of the points, without intermediate arrays
+    f = einsum('ij,ij->i', xyz, xyz)
+
+    # solve the normal equations
+    # the system is only 4x4, regardless of the number of points
+    C = solve(A.T.dot(A), A.T.dot(f))
 
     # solve for the radius
     t = (C[0]*C[0]) + (C[1]*C[1]) + (C[2]*C[2]) + C[3]
-    radius = sqrt(t)
-    return [float(C[0][0]), float(C[1][0]), float(C[2][0])], radius
+    radius = float(sqrt(t))
+    return (C[:3] + c).tolist(), radius
 
 
 # ==============================================================================
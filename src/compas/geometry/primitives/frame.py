@@ -4,12 +4,13 @@ import math
 
 from compas.geometry.basic import cross_vectors
 from compas.geometry.basic import subtract_vectors
+from compas.geometry.basic import dot_vectors
+from compas.geometry.basic import normalize_vector
 from compas.geometry.basic import allclose
 
 from compas.geometry.xforms import Transformation
 from compas.geometry.xforms import Rotation
 
-from compas.geometry.transformations import matrix_from_basis_vectors
 from compas.geometry.transformations import basis_vectors_from_matrix
 from compas.geometry.transformations import quaternion_from_matrix
 from compas.geometry.transformations import matrix_from_quaternion
@@ -17,9 +18,8 @@ from compas.geometry.transformations import axis_angle_vector_from_matrix
 from compas.geometry.transformations import matrix_from_axis_angle_vector
 from compas.geometry.transformations import euler_angles_from_matrix
 from compas.geometry.transformations import matrix_from_euler_angles
-from compas.geometry.transformations import decompose_matrix
-from compas.geometry.transformations import inverse
 from compas.geometry.transformations import matrix_from_frame
+from compas.geometry.transformations import matrix_from_basis_vectors
 
 from compas.geometry.primitives import Point
 from compas.geometry.primitives import Vector
@@ -28,6 +28,25 @@ from compas.geometry.primitives import Plane
 __all__ = ['Frame']
 
 
+def _orthonormalize(xaxis, yaxis):
+    # unitize the xaxis, and make the yaxis a unit vector perpendicular to it,
+    # in the plane of both vectors
+    # written out in scalars, since this runs for every frame that is created
+    x0, x1, x2 = xaxis
+    length = math.sqrt(x0 * x0 + x1 * x1 + x2 * x2)
+    x0, x1, x2 = x0 / length, x1 / length, x2 / length
+    y0, y1, y2 = yaxis
+    z0 = x1 * y2 - x2 * y1
+    z1 = x2 * y0 - x0 * y2
+    z2 = x0 * y1 - x1 * y0
+    length = math.sqrt(z0 * z0 + z1 * z1 + z2 * z2)
+    z0, z1, z2 = z0 / length, z1 / length, z2 / length
+    y0 = z1 * x2 - z2 * x1
+    y1 = z2 * x0 - z0 * x2
+    y2 = z0 * x1 - z1 * x0
+    return [x0, x1, x2], [y0, y1, y2]
+
+
 class Frame(object):
     """A frame is defined by a base point and two orthonormal base vectors.
 
@@ -62,14 +81,35 @@ class Frame(object):
         self._point = None
         self._xaxis = None
         self._yaxis = None
+        self._matrix = None
+        self._matrix_inv = None
+        self._matrix_key = None
+        self._rotation = None
+        self._rotation_key = None
         self.point = point
-        self.xaxis = xaxis
-        self.yaxis = yaxis
+        xaxis, yaxis = _orthonormalize(xaxis, yaxis)
+        self._xaxis = Vector(*xaxis)
+        self._yaxis = Vector(*yaxis)
 
     # ==========================================================================
     # factory
     # ==========================================================================
 
+    @classmethod
+    def _from_orthonormal_axes(cls, point, xaxis, yaxis):
+        # construct a frame from axes that are known to be orthonormal
+        # without orthonormalizing them again in the constructor
+        frame = cls.__new__(cls)
+        frame._point = Point(*point)
+        frame._xaxis = Vector(*xaxis)
+        frame._yaxis = Vector(*yaxis)
+        frame._matrix = None
+        frame._matrix_inv = None
+        frame._matrix_key = None
+        frame._rotation = None
+        frame._rotation_key = None
+        return frame
+
     @classmethod
     def worldXY(cls):
         """Construct the world XY frame.
@@ -80,7 +120,7 @@ class Frame(object):
             The world XY frame.
 
         """
-        return cls([0, 0, 0], [1, 0, 0], [0, 1, 0])
+        return cls._from_orthonormal_axes([0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
 
     @classmethod
     def worldZX(cls):
@@ -92,7 +132,7 @@ class Frame(object):
             The world ZX frame.
 
         """
-        return cls([0, 0, 0], [0, 0, 1], [1, 0, 0])
+        return cls._from_orthonormal_axes([0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [1.0, 0.0, 0.0])
 
     @classmethod
     def worldYZ(cls):
@@ -104,7 +144,7 @@ class Frame(object):
             The world YZ frame.
 
         """
-        return cls([0, 0, 0], [0, 1, 0], [0, 0, 1])
+        return cls._from_orthonormal_axes([0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0])
 
     @classmethod
     def from_points(cls, point, point_xaxis, point_xyplane):
@@ -222,9 +262,9 @@ class Frame(object):
         True
 
         """
-        sc, sh, a, point, p = decompose_matrix(matrix)
-        R = matrix_from_euler_angles(a, static=True, axes='xyz')
-        xaxis, yaxis = basis_vectors_from_matrix(R)
+        point = [matrix[0][3], matrix[1][3], matrix[2][3]]
+        xaxis = [matrix[0][0], matrix[1][0], matrix[2][0]]
+        yaxis = [matrix[0][1], matrix[1][1], matrix[2][1]]
         return cls(point, xaxis, yaxis)
 
     @classmethod
@@ -260,19 +300,17 @@ class Frame(object):
 
         """
 
-        if len(values) == 12:
-            values.extend([0., 0., 0., 1.])
-        if len(values) != 16:
+        if len(values) not in (12, 16):
             raise ValueError(
                 'Expected 12 or 16 floats but got %d' %
                 len(values))
 
-        matrix = [[0. for i in range(4)] for j in range(4)]
-        for i in range(4):
-            for j in range(4):
-                matrix[i][j] = float(values[i * 4 + j])
-
-        return cls.from_matrix(matrix)
+        # the axes are the first two columns
+        # and the translation is the last column
+        point = [float(values[3]), float(values[7]), float(values[11])]
+        xaxis = [float(values[0]), float(values[4]), float(values[8])]
+        yaxis = [float(values[1]), float(values[5]), float(values[9])]
+        return cls(point, xaxis, yaxis)
 
     @classmethod
     def from_quaternion(cls, quaternion, point=[0, 0, 0]):
@@ -424,32 +462,21 @@ class Frame(object):
         """
 
         # plane equation: a*x + b*y + c*z = d
-        d = Vector(*plane.point).dot(plane.normal)
-
-        # select 2 arbitrary points in the plane from which we create the xaxis
-
-        coeffs = list(plane.normal)  # a, b, c
-        # select a coeff with a value != 0
-        coeffs_abs = [math.fabs(x) for x in coeffs]
-        idx = coeffs_abs.index(max(coeffs_abs))
-
-        # first point
-        coords = [0, 0, 0]  # x, y, z
-        # z = (d - a*0 + b*0)/c, if idx == 2
-        v = d/coeffs[idx]
-        coords[idx] = v
-        pt1_in_plane = Point(*coords)
-
-        # second point
-        coords = [1, 1, 1]  # x, y, z
-        coords[idx] = 0
-        # z = (d - a*1 + b*1)/c, if idx == 2
-        v = (d - sum([a*x for a, x in zip(coeffs, coords)]))/coeffs[idx]
-        coords[idx] = v
-        pt2_in_plane = Point(*coords)
-
-        xaxis = pt2_in_plane - pt1_in_plane
-        yaxis = plane.normal.cross(xaxis)
+        # the xaxis connects two points in the plane,
+        # the first with the other coordinates at zero,
+        # the second with the other coordinates at one,
+        # solved for the coordinate with the largest coefficient
+        # the offset d cancels in the difference of both points
+        normal = plane.normal
+        a, b, c = normal
+        fa, fb, fc = math.fabs(a), math.fabs(b), math.fabs(c)
+        if fa >= fb and fa >= fc:
+            xaxis = [(0.0 - b - c) / a, 1.0, 1.0]
+        elif fb >= fc:
+            xaxis = [1.0, (0.0 - a - c) / b, 1.0]
+        else:
+            xaxis = [1.0, 1.0, (0.0 - a - b) / c]
+        yaxis = cross_vectors(normal, xaxis)
         return cls(plane.point, xaxis, yaxis)
 
     # ==========================================================================
@@ -470,9 +497,7 @@ class Frame(object):
 
     @xaxis.setter
     def xaxis(self, vector):
-        xaxis = Vector(*vector)
-        xaxis.unitize()
-        self._xaxis = xaxis
+        self._xaxis = Vector(*normalize_vector(vector))
 
     @property
     def yaxis(self):
@@ -480,11 +505,8 @@ class Frame(object):
 
     @yaxis.setter
     def yaxis(self, vector):
-        yaxis = Vector(*vector)
-        yaxis.unitize()
-        zaxis = Vector.cross(self.xaxis, yaxis)
-        zaxis.unitize()
-        self._yaxis = Vector.cross(zaxis, self.xaxis)
+        _, yaxis = _orthonormalize(self._xaxis, vector)
+        self._yaxis = Vector(*yaxis)
 
     @property
     def data(self):
@@ -531,14 +553,60 @@ class Frame(object):
     def quaternion(self):
         """:obj:`list` of :obj:`float` : The 4 quaternion coefficients from the rotation given by the frame.
         """
-        rotation = matrix_from_basis_vectors(self.xaxis, self.yaxis)
-        return quaternion_from_matrix(rotation)
+        return quaternion_from_matrix(self._R)
 
     @property
     def axis_angle_vector(self):
         """vector : The axis-angle vector from the rotation given by the frame."""
-        R = matrix_from_basis_vectors(self.xaxis, self.yaxis)
-        return axis_angle_vector_from_matrix(R)
+        return axis_angle_vector_from_matrix(self._R)
+
+    @property
+    def matrix(self):
+        """:obj:`list` of :obj:`list` of :obj:`float` : The 4x4 transformation matrix from world XY to the frame.
+
+        The matrix is cached, and should not be modified.
+        """
+        self._check_matrix_cache()
+        if self._matrix is None:
+            self._matrix = matrix_from_frame(self)
+        return self._matrix
+
+    @property
+    def matrix_inv(self):
+        """:obj:`list` of :obj:`list` of :obj:`float` : The 4x4 transformation matrix from the frame to world XY.
+
+        The matrix is cached, and should not be modified.
+        """
+        self._check_matrix_cache()
+        if self._matrix_inv is None:
+            # the frame is orthonormal
+            # so the inverse of [R | t] is [R^T | -R^T t]
+            M = self.matrix
+            M_inv = [[M[j][i] for j in range(3)] + [0.0] for i in range(3)] + [[0.0, 0.0, 0.0, 1.0]]
+            for i in range(3):
+                M_inv[i][3] = - M_inv[i][0] * M[0][3] - M_inv[i][1] * M[1][3] - M_inv[i][2] * M[2][3]
+            self._matrix_inv = M_inv
+        return self._matrix_inv
+
+    @property
+    def _R(self):
+        # the rotation matrix of the frame
+        # cached separately from the full matrix,
+        # since it does not depend on the point
+        key = tuple(self._xaxis) + tuple(self._yaxis)
+        if key != self._rotation_key:
+            self._rotation_key = key
+            self._rotation = matrix_from_basis_vectors(self._xaxis, self._yaxis)
+        return self._rotation
+
+    def _check_matrix_cache(self):
+        # the cached matrices are only valid for the current components of the frame
+        # which can also be changed in place, for example with frame.point.x = 1.0
+        key = tuple(self._point) + tuple(self._xaxis) + tuple(self._yaxis)
+        if key != self._matrix_key:
+            self._matrix_key = key
+            self._matrix = None
+            self._matrix_inv = None
 
     # ==========================================================================
     # representation
@@ -582,11 +650,16 @@ class Frame(object):
     # ==========================================================================
 
     def __eq__(self, other, tol=1e-05):
-        for v1, v2 in zip(self, other):
-            for a, b in zip(v1, v2):
-                if math.fabs(a - b) > tol:
-                    return False
-        return True
+        # compare all nine components at once
+        # instead of looping over the vectors and their coordinates
+        (p0, p1, p2), (x0, x1, x2), (y0, y1, y2) = other
+        a0, a1, a2 = self._point
+        b0, b1, b2 = self._xaxis
+        c0, c1, c2 = self._yaxis
+        fabs = math.fabs
+        return max(fabs(a0 - p0), fabs(a1 - p1), fabs(a2 - p2),
+                   fabs(b0 - x0), fabs(b1 - x1), fabs(b2 - x2),
+                   fabs(c0 - y0), fabs(c1 - y1), fabs(c2 - y2)) <= tol
 
     # ==========================================================================
     # operators
@@ -644,8 +717,7 @@ class Frame(object):
         True
 
         """
-        R = matrix_from_basis_vectors(self.xaxis, self.yaxis)
-        return euler_angles_from_matrix(R, static, axes)
+        return euler_angles_from_matrix(self._R, static, axes)
 
     def represent_point_in_local_coordinates(self, point):
         """Represents a point in the frame's local coordinate system.
@@ -671,10 +743,11 @@ class Frame(object):
         True
 
         """
-        pt = Point(*subtract_vectors(point, self.point))
-        T = inverse(matrix_from_basis_vectors(self.xaxis, self.yaxis))
-        pt.transform(T)
-        return pt
+        xaxis = self._xaxis
+        yaxis = self._yaxis
+        zaxis = cross_vectors(xaxis, yaxis)
+        d = subtract_vectors(point, self._point)
+        return Point(dot_vectors(xaxis, d), dot_vectors(yaxis, d), dot_vectors(zaxis, d))
 
     def represent_point_in_global_coordinates(self, point):
         """Represents a point from local coordinates in the world coordinate system.
@@ -700,10 +773,89 @@ class Frame(object):
         True
 
         """
-        T = matrix_from_frame(self)
-        pt = Point(*point)
-        pt.transform(T)
-        return pt
+        x, y, z = point
+        o = self._point
+        u = self._xaxis
+        v = self._yaxis
+        w = cross_vectors(u, v)
+        return Point(o[0] + x * u[0] + y * v[0] + z * w[0],
+                     o[1] + x * u[1] + y * v[1] + z * w[1],
+                     o[2] + x * u[2] + y * v[2] + z * w[2])
+
+    def represent_points_in_local_coordinates(self, points):
+        """Represents multiple points in the frame's local coordinate system.
+
+        Parameters
+        ----------
+        points : :obj:`list` of :obj:`list` of :obj:`float` or :obj:`list` of :class:`Point`
+            Points in world XY.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`list` of :obj:`float`
+            XYZ coordinates of the points in the local coordinate system of the frame.
+
+        Notes
+        -----
+        This is equivalent to calling :meth:`represent_point_in_local_coordinates`
+        for every point, but the axes of the frame are unpacked only once.
+
+        Examples
+        --------
+        >>> from compas.geometry import Frame
+        >>> f = Frame([1, 1, 1], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+        >>> pw1 = [[2, 2, 2], [0, 1, 2]]
+        >>> pf = f.represent_points_in_local_coordinates(pw1)
+        >>> pw2 = f.represent_points_in_global_coordinates(pf)
+        >>> all(allclose(a, b) for a, b in zip(pw1, pw2))
+        True
+
+        """
+        ox, oy, oz = self._point
+        ux, uy, uz = self._xaxis
+        vx, vy, vz = self._yaxis
+        wx, wy, wz = cross_vectors(self._xaxis, self._yaxis)
+        local = []
+        for x, y, z in points:
+            dx = x - ox
+            dy = y - oy
+            dz = z - oz
+            local.append([ux * dx + uy * dy + uz * dz,
+                          vx * dx + vy * dy + vz * dz,
+                          wx * dx + wy * dy + wz * dz])
+        return local
+
+    def represent_points_in_global_coordinates(self, points):
+        """Represents multiple points from local coordinates in the world coordinate system.
+
+        Parameters
+        ----------
+        points : :obj:`list` of :obj:`list` of :obj:`float` or :obj:`list` of :class:`Point`
+            Points in local coordinates.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`list` of :obj:`float`
+            XYZ coordinates of the points in the world coordinate system.
+
+        Examples
+        --------
+        >>> from compas.geometry import Frame
+        >>> f = Frame([1, 1, 1], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+        >>> pw1 = [[2, 2, 2], [0, 1, 2]]
+        >>> pf = f.represent_points_in_local_coordinates(pw1)
+        >>> pw2 = f.represent_points_in_global_coordinates(pf)
+        >>> all(allclose(a, b) for a, b in zip(pw1, pw2))
+        True
+
+        """
+        ox, oy, oz = self._point
+        ux, uy, uz = self._xaxis
+        vx, vy, vz = self._yaxis
+        wx, wy, wz = cross_vectors(self._xaxis, self._yaxis)
+        return [[ox + x * ux + y * vx + z * wx,
+                 oy + x * uy + y * vy + z * wy,
+                 oz + x * uz + y * vz + z * wz] for x, y, z in points]
 
     def represent_vector_in_local_coordinates(self, vector):
         """Represents a vector in the frame's local coordinate system.
@@ -729,10 +881,10 @@ class Frame(object):
         True
 
         """
-        T = inverse(matrix_from_basis_vectors(self.xaxis, self.yaxis))
-        vec = Vector(*vector)
-        vec.transform(T)
-        return vec
+        xaxis = self._xaxis
+        yaxis = self._yaxis
+        zaxis = cross_vectors(xaxis, yaxis)
+        return Vector(dot_vectors(xaxis, vector), dot_vectors(yaxis, vector), dot_vectors(zaxis, vector))
 
     def represent_vector_in_global_coordinates(self, vector):
         """Represents a vector in local coordinates in the world coordinate system.
@@ -758,10 +910,13 @@ class Frame(object):
         True
 
         """
-        T = matrix_from_frame(self)
-        vec = Vector(*vector)
-        vec.transform(T)
-        return vec
+        x, y, z = vector
+        u = self._xaxis
+        v = self._yaxis
+        w = cross_vectors(u, v)
+        return Vector(x * u[0] + y * v[0] + z * w[0],
+                      x * u[1] + y * v[1] + z * w[1],
+                      x * u[2] + y * v[2] + z * w[2])
 
     def represent_frame_in_local_coordinates(self, frame):
         """Represents another frame in the frame's local coordinate system.
@@ -790,7 +945,7 @@ class Frame(object):
         True
 
         """
-        T = Transformation.from_frame(self).inverse()
+        T = Transformation(self.matrix_inv)
         f = frame.copy()
         f.transform(T)
         return f
@@ -824,7 +979,7 @@ class Frame(object):
         True
 
         """
-        T = Transformation.from_frame(self)
+        T = Transformation(self.matrix)
         f = frame.copy()
         f.transform(T)
         return f
@@ -853,12 +1008,27 @@ class Frame(object):
         True
 
         """
-        T = transformation * Transformation.from_frame(self)
-        point = T.translation
-        xaxis, yaxis = T.basis_vectors
-        self.point = point
-        self.xaxis = xaxis
-        self.yaxis = yaxis
+        M = transformation.matrix
+        (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23) = M[0], M[1], M[2]
+        px, py, pz = self._point
+        xx, xy, xz = self._xaxis
+        yx, yy, yz = self._yaxis
+        # transform the point and the axes directly
+        # instead of multiplying with the matrix of the frame
+        # and decomposing the result
+        point = [m00 * px + m01 * py + m02 * pz + m03,
+                 m10 * px + m11 * py + m12 * pz + m13,
+                 m20 * px + m21 * py + m22 * pz + m23]
+        xaxis = [m00 * xx + m01 * xy + m02 * xz,
+                 m10 * xx + m11 * xy + m12 * xz,
+                 m20 * xx + m21 * xy + m22 * xz]
+        yaxis = [m00 * yx + m01 * yy + m02 * yz,
+                 m10 * yx + m11 * yy + m12 * yz,
+                 m20 * yx + m21 * yy + m22 * yz]
+        xaxis, yaxis = _orthonormalize(xaxis, yaxis)
+        self._point = Point(*point)
+        self._xaxis = Vector(*xaxis)
+        self._yaxis = Vector(*yaxis)
 
     def transformed(self, transformation):
         """Returns a transformed copy of the current frame.
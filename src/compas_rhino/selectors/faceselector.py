@@ -8,6 +8,7 @@ import compas
 
 try:
     import rhinoscriptsyntax as rs
+    FACE_FILTER = rs.filter.mesh | rs.filter.textdot
 except ImportError:
     compas.raise_if_ironpython()
 
@@ -15,36 +16,56 @@ except ImportError:
 __all__ = ['FaceSelector']
 
 
+_KEY_CACHE = {}
+
+
+def _parse_key(key):
+    # face keys are usually integers
+    # which are parsed much faster with int than with literal_eval
+    try:
+        return _KEY_CACHE[key]
+    except KeyError:
+        pass
+    try:
+        value = int(key)
+    except ValueError:
+        value = ast.literal_eval(key)
+    _KEY_CACHE[key] = value
+    return value
+
+
 class FaceSelector(object):
 
     @staticmethod
     def select_face(self, message="Select a face."):
-        guid = rs.GetObject(message, preselect=True, filter=rs.filter.mesh | rs.filter.textdot)
+        guid = rs.GetObject(message, preselect=True, filter=FACE_FILTER)
         if guid:
             prefix = self.attributes['name']
-            name = rs.ObjectName(guid).split('.')
-            if 'face' in name:
-                if not prefix or prefix in name:
-                    key = name[-1]
-                    key = ast.literal_eval(key)
-                    return key
+            name = rs.ObjectName(guid)
+            if '.face.' in name:
+                if not prefix or name.startswith(prefix + '.'):
+                    key = name.rsplit('.', 1)[-1]
+                    return _parse_key(key)
         return None
 
     @staticmethod
     def select_faces(self, message="Select faces."):
         keys = []
-        guids = rs.GetObjects(message, preselect=True, filter=rs.filter.mesh | rs.filter.textdot)
+        guids = rs.GetObjects(message, preselect=True, filter=FACE_FILTER)
         if guids:
             prefix = self.attributes['name']
+            if prefix:
+                prefix += '.'
             seen = set()
             for guid in guids:
-                name = rs.ObjectName(guid).split('.')
-                if 'face' in name:
-                    if not prefix or prefix in name:
-                        key = name[-1]
-                        if not seen.add(key):
-                            key = ast.literal_eval(key)
-                            keys.append(key)
+                # the names have the format "{prefix}.face.{key}"
+                name = rs.ObjectName(guid)
+                if '.face.' in name:
+                    if not prefix or name.startswith(prefix):
+                        key = name.rsplit('.', 1)[-1]
+                        if key not in seen:
+                            seen.add(key)
+                            keys.append(_parse_key(key))
         return keys
 
 
@@ -0,0 +1,82 @@
+from math import cos
+from math import sin
+
+from numpy import isfinite
+
+from compas.geometry import allclose
+from compas.geometry import bestfit_plane_numpy
+from compas.geometry import bestfit_planes_numpy
+from compas.geometry import bestfit_circle_numpy
+from compas.geometry import bestfit_sphere_numpy
+
+
+def test_bestfit_plane_numpy():
+    points = [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0], [0.5, 0.5, 1.0]]
+    c, n = bestfit_plane_numpy(points)
+    assert allclose(c.tolist()[0], [0.5, 0.5, 1.0])
+    assert allclose([abs(x) for x in n], [0.0, 0.0, 1.0])
+
+
+def test_bestfit_sphere_numpy():
+    points = [[1.0, 2.0, 3.0], [-1.0, 2.0, 3.0], [0.0, 3.0, 3.0], [0.0, 1.0, 3.0], [0.0, 2.0, 4.0], [0.0, 2.0, 2.0]]
+    center, radius = bestfit_sphere_numpy(points)
+    assert allclose(center, [0.0, 2.0, 3.0])
+    assert abs(radius - 1.0) < 1e-6
+
+
+def test_bestfit_circle_numpy():
+    points = [[3.0 + 2.0 * cos(0.1 * i), 1.0 + 2.0 * sin(0.1 * i), 5.0] for i in range(40)]
+    center, normal, radius = bestfit_circle_numpy(points)
+    assert allclose(center, [3.0, 1.0, 5.0])
+    assert allclose([abs(x) for x in normal], [0.0, 0.0, 1.0])
+    assert abs(radius - 2.0) < 1e-6
+
+
+def test_bestfit_plane_numpy_three_points():
+    points = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    c, n = bestfit_plane_numpy(points)
+    assert allclose(c.tolist()[0], [1.0 / 3, 1.0 / 3, 1.0 / 3])
+    assert allclose([abs(x) for x in n], [3 ** -0.5] * 3)
+
+
+def test_bestfit_planes_numpy():
+    points = [[[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0], [0.5, 0.5, 1.0]],
+              [[2.0, 0.0, 0.0], [2.0, 1.0, 0.0], [2.0, 1.0, 1.0], [2.0, 0.0, 1.0], [2.0, 0.5, 0.5]]]
+    c, n = bestfit_planes_numpy(points)
+    for i in range(2):
+        ci, ni = bestfit_plane_numpy(points[i])
+        assert allclose(c[i].tolist(), ci.tolist()[0])
+        assert allclose([abs(x) for x in n[i]], [abs(x) for x in ni])
+
+
+def test_bestfit_plane_numpy_far_from_origin():
+    offset = 5e6
+    grid = [(0.25 * i, 0.25 * j) for i in range(5) for j in range(5)]
+    points = [[offset + x, offset + y, offset + 0.1 * x + 0.2 * y] for x, y in grid]
+    c, n = bestfit_plane_numpy(points)
+    normal = [-0.1, -0.2, 1.0]
+    length = sum(x ** 2 for x in normal) ** 0.5
+    assert allclose([abs(x) for x in n], [abs(x) / length for x in normal], tol=1e-9)
+
+
+def test_bestfit_plane_numpy_three_collinear_points():
+    points = [[0.0, 0.0, 0.0], [1.0, 1.0, 0.0], [2.0, 2.0, 0.0]]
+    c, n = bestfit_plane_numpy(points)
+    assert allclose(c.tolist()[0], [1.0, 1.0, 0.0])
+    assert isfinite(n).all()
+    assert abs(n[0] + n[1]) < 1e-9
+
+
+def test_bestfit_sphere_numpy_far_from_origin():
+    offset = 1e5
+    points = []
+    for i in range(20):
+        for j in range(10):
+            u = 0.31 * i
+            v = 0.3 * j + 0.1
+            points.append([offset + 1.0 + 2.0 * cos(u) * sin(v),
+                           offset + 2.0 + 2.0 * sin(u) * sin(v),
+                           offset + 3.0 + 2.0 * cos(v)])
+    center, radius = bestfit_sphere_numpy(points)
+    assert allclose(center, [offset + 1.0, offset + 2.0, offset + 3.0], tol=1e-6)
+    assert abs(radius - 2.0) < 1e-6
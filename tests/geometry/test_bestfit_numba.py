@@ -0,0 +1,46 @@
+from math import cos
+from math import sin
+
+from compas.geometry import allclose
+from compas.geometry import bestfit_circle_numpy
+from compas.geometry import bestfit_sphere_numpy
+from compas.geometry.bestfit.bestfit_numba import bestfit_circle_numba
+from compas.geometry.bestfit.bestfit_numba import bestfit_sphere_numba
+
+
+def sphere_points(center, radius):
+    points = []
+    for i in range(20):
+        for j in range(10):
+            u = 0.31 * i
+            v = 0.3 * j + 0.1
+            points.append([center[0] + radius * cos(u) * sin(v),
+                           center[1] + radius * sin(u) * sin(v),
+                           center[2] + radius * cos(v)])
+    return points
+
+
+def test_bestfit_sphere_numba():
+    points = sphere_points([1.0, 2.0, 3.0], 2.0)
+    center, radius = bestfit_sphere_numba(points)
+    c, r = bestfit_sphere_numpy(points)
+    assert allclose(center, c)
+    assert abs(radius - r) < 1e-6
+
+
+def test_bestfit_sphere_numba_far_from_origin():
+    offset = 1e5
+    points = sphere_points([offset + 1.0, offset + 2.0, offset + 3.0], 2.0)
+    center, radius = bestfit_sphere_numba(points)
+    c, r = bestfit_sphere_numpy(points)
+    assert allclose(center, c, tol=1e-6)
+    assert abs(radius - r) < 1e-6
+
+
+def test_bestfit_circle_numba():
+    points = [[3.0 + 2.0 * cos(0.1 * i), 1.0 + 2.0 * sin(0.1 * i), 5.0 + 0.001 * (-1) ** i] for i in range(40)]
+    center, normal, radius = bestfit_circle_numba(points)
+    c, n, r = bestfit_circle_numpy(points)
+    assert allclose(center, c)
+    assert allclose([abs(x) for x in normal], [abs(x) for x in n])
+    assert abs(radius - r) < 1e-6
@@ -0,0 +1,108 @@
+from compas.geometry import allclose
+from compas.geometry import multiply_matrices
+from compas.geometry import Frame
+from compas.geometry import Plane
+from compas.geometry import Reflection
+from compas.geometry import Transformation
+
+
+def test_frame_represent_point():
+    f = Frame([1, 1, 1], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+    pw1 = [2, 2, 2]
+    pf = f.represent_point_in_local_coordinates(pw1)
+    pw2 = f.represent_point_in_global_coordinates(pf)
+    assert allclose(pw1, pw2)
+
+
+def test_frame_matrix_cache():
+    f = Frame([0, 0, 0], [1, 0, 0], [0, 1, 0])
+    assert allclose([row[3] for row in f.matrix], [0, 0, 0, 1])
+    assert allclose([row[3] for row in f.matrix_inv], [0, 0, 0, 1])
+    f.point = [1, 1, 1]
+    assert allclose([row[3] for row in f.matrix], [1, 1, 1, 1])
+    assert allclose([row[3] for row in f.matrix_inv], [-1, -1, -1, 1])
+    f.point.z = 3
+    assert allclose([row[3] for row in f.matrix], [1, 1, 3, 1])
+    assert allclose([row[3] for row in f.matrix_inv], [-1, -1, -3, 1])
+    f.xaxis.x = -1
+    assert allclose(f.matrix[0][:3], [-1, 0, 0])
+    other = Frame([1, 2, 3], [1, 0, 0], [0, 1, 0])
+    assert allclose(f.represent_frame_in_local_coordinates(other).point, [0, 1, 0])
+
+
+def test_frame_represent_points():
+    f = Frame([1, 2, 3], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+    points = [[2, 2, 2], [0, 1, 2], [-1, 5, 3]]
+    local = f.represent_points_in_local_coordinates(points)
+    for point, a in zip(points, local):
+        assert allclose(a, f.represent_point_in_local_coordinates(point))
+    for point, b in zip(points, f.represent_points_in_global_coordinates(local)):
+        assert allclose(point, b)
+
+
+def test_frame_from_list():
+    values = [-1.0, 0.0, 0.0, 8110, 0.0, 0.0, -1.0, 7020, 0.0, -1.0, 0.0, 1810]
+    f = Frame.from_list(values)
+    assert allclose(f.point, [8110, 7020, 1810])
+    assert allclose(f.xaxis, [-1, 0, 0])
+    assert allclose(f.yaxis, [0, 0, -1])
+    assert len(values) == 12
+
+
+def test_frame_from_matrix():
+    f1 = Frame([1, 2, 3], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+    f2 = Frame.from_matrix(f1.matrix)
+    assert allclose(f1.point, f2.point)
+    assert allclose(f1.xaxis, f2.xaxis)
+    assert allclose(f1.yaxis, f2.yaxis)
+
+
+def test_frame_eq():
+    f = Frame([1, 2, 3], [1, 0, 0], [0, 1, 0])
+    assert f == f.copy()
+    assert f == [[1, 2, 3], [1, 0, 0], [0, 1, 0]]
+    assert not f == [[1, 2, 3.1], [1, 0, 0], [0, 1, 0]]
+    assert not f == Frame([1, 2, 3], [0, 1, 0], [-1, 0, 0])
+
+
+def test_frame_transform():
+    f1 = Frame([1, 1, 1], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+    f2 = Frame([4, -1, 2], [0.2, 0.9, 0.1], [-0.9, 0.2, 0.3])
+    T = Transformation.from_frame(f2)
+    f3 = f1.transformed(T)
+    assert f3 == Frame.from_matrix(multiply_matrices(T.matrix, f1.matrix))
+
+
+def test_frame_transform_reflection():
+    # the axes are the images of the original axes under the reflection
+    # the handedness of the frame is preserved, so the zaxis is not
+    f1 = Frame([1, 1, 1], [0.68, 0.68, 0.27], [-0.67, 0.73, -0.15])
+    f2 = f1.transformed(Reflection([0, 0, 0], [0, 0, 1]))
+    assert allclose(f2.point, [1, 1, -1])
+    assert allclose(f2.xaxis, [f1.xaxis.x, f1.xaxis.y, -f1.xaxis.z])
+    assert allclose(f2.yaxis, [f1.yaxis.x, f1.yaxis.y, -f1.yaxis.z])
+
+
+def test_frame_worldXY():
+    f1 = Frame.worldXY()
+    f1.point.x = 1.0
+    f2 = Frame.worldXY()
+    assert f2 == Frame([0, 0, 0], [1, 0, 0], [0, 1, 0])
+    assert allclose(f1.matrix[0], [1, 0, 0, 1])
+
+
+def test_frame_from_plane():
+    plane = Plane([1, 2, 3], [1, 2, 3])
+    f = Frame.from_plane(plane)
+    assert allclose(f.point, plane.point)
+    assert allclose(f.normal, plane.normal)
+
+
+def test_frame_rotation_cache():
+    f = Frame.from_euler_angles([0.5, 0.4, 0.8], point=[1, 2, 3])
+    q = f.quaternion
+    f.point = [4, 5, 6]
+    assert allclose(f.quaternion, q)
+    f.xaxis = [0, 1, 0]
+    f.yaxis = [-1, 0, 0]
+    assert allclose(f.euler_angles(), [0, 0, 1.5707963267948966])